@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for cli.py's offline subcommands.
+
+Runs each offline command in a fresh interpreter against a throwaway database and
+fails (exit status 1) if any of them:
+  - imports a heavy dependency (Google API clients, transcript API, tkinter), or
+  - takes longer than the budget (median wall time, default 100 ms).
+
+    python bench_cli_startup.py [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HEAVY_MODULES = [
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "google.auth",
+    "youtube_transcript_api",
+    "tkinter",
+]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Runs cli.main() in-process, then reports which heavy modules ended up loaded.
+PROBE = """
+import sys
+sys.path.insert(0, {here!r})
+import cli
+try:
+    cli.main({argv!r})
+except SystemExit:
+    pass
+loaded = [m for m in {heavy!r} if m in sys.modules]
+sys.stderr.write("LOADED:" + ",".join(loaded) + "\\n")
+"""
+
+
+def offline_commands(db_path, output_file):
+    return {
+        "--help": ["--help"],
+        "migrate": ["--db", db_path, "migrate"],
+        "inspect": ["--db", db_path, "inspect"],
+        "export": ["--db", db_path, "export", "--output", output_file],
+    }
+
+
+def bare_startup():
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], capture_output=True)
+    return time.perf_counter() - start
+
+
+def run_once(argv):
+    code = PROBE.format(here=HERE, argv=argv, heavy=HEAVY_MODULES)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=HERE)
+    elapsed = time.perf_counter() - start
+
+    # None means the probe never reached its report (the command crashed)
+    loaded = None
+    for line in result.stderr.splitlines():
+        if line.startswith("LOADED:"):
+            loaded = [m for m in line[len("LOADED:"):].split(",") if m]
+    return elapsed, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Guard cli.py startup time for offline subcommands.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    # Baseline: a bare interpreter, so the report shows the CLI's own overhead
+    baseline = statistics.median(bare_startup() for _ in range(args.runs))
+    print(f"{'python -c pass':<16} {baseline * 1000:7.1f} ms")
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        output_file = os.path.join(tmp, "export.json")
+        commands = offline_commands(db_path, output_file)
+
+        # Make sure the schema exists before timing export/inspect
+        run_once(commands["migrate"])
+
+        for name, argv in commands.items():
+            timings = []
+            loaded = None
+            for _ in range(args.runs):
+                elapsed, loaded = run_once(argv)
+                timings.append(elapsed)
+            median_ms = statistics.median(timings) * 1000
+
+            status = "ok"
+            if loaded is None:
+                status = "FAIL (command crashed)"
+                failed = True
+            elif loaded:
+                status = f"FAIL (imported {', '.join(loaded)})"
+                failed = True
+            elif median_ms > args.budget_ms:
+                status = f"FAIL (over {args.budget_ms:.0f} ms budget)"
+                failed = True
+            print(f"{name:<16} {median_ms:7.1f} ms  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the transcript tool.
+
+    python cli.py [--db PATH] {ingest,sync,export,migrate,inspect,gui} ...
+
+Only argparse and the lightweight database/export modules are imported up front.
+Each subcommand imports what else it needs when it runs, so offline commands
+(export, migrate, inspect) never load the Google API clients or tkinter.
+"""
+
+import argparse
+import os
+import sys
+
+from database import DEFAULT_DB_PATH, DEFAULT_LANGUAGES
+from extract_transcripts import SORT_ORDERS
+
+DEFAULT_CLIENT_SECRETS = "client_secret.json"
+
+
+def parse_languages(value):
+    """Split a comma-separated --languages value into a priority-ordered tuple of language codes."""
+    languages = tuple(code.strip() for code in value.split(",") if code.strip())
+    if not languages:
+        raise argparse.ArgumentTypeError("expected at least one language code")
+    return languages
+
+
+def require_database(db_path):
+    """
+    Return True if db_path exists. Otherwise print an error and return False, so offline
+    commands don't silently create an empty database from a mistyped --db.
+    """
+    if os.path.exists(db_path):
+        return True
+    print(f"Error: database '{db_path}' not found. Run 'migrate' or 'ingest' to create it.", file=sys.stderr)
+    return False
+
+
+# ----------------------------------------------------------
+# Online subcommands (YouTube Data API + transcript API)
+# ----------------------------------------------------------
+def cmd_ingest(args):
+    """Download transcripts for individual videos, or run the interactive menu if no URLs are given."""
+    import transcriber
+
+    if not args.urls:
+        transcriber.main(db_path=args.db, client_secrets_file=args.client_secrets, languages=args.languages,
+                         refresh=args.refresh_listings)
+        return 0
+
+    conn = transcriber.create_database(db_path=args.db)
+    try:
+        transcriber.upgrade_schema(conn)
+        youtube = transcriber.authenticate_youtube_api(args.client_secrets)
+        for video_url in args.urls:
+            transcriber.download_single_video_transcript(
+                youtube, conn, video_url, args.languages, refresh=args.refresh_listings
+            )
+    finally:
+        conn.close()
+    return 0
+
+
+def cmd_sync(args):
+    """Download transcripts for a channel's uploads."""
+    import transcriber
+
+    conn = transcriber.create_database(db_path=args.db)
+    try:
+        transcriber.upgrade_schema(conn)
+        youtube = transcriber.authenticate_youtube_api(args.client_secrets)
+        transcriber.download_channel_videos_transcripts(
+            youtube, conn, args.channel_url, selection=args.select, languages=args.languages,
+            refresh=args.refresh_listings
+        )
+    finally:
+        conn.close()
+    return 0
+
+
+# ----------------------------------------------------------
+# Offline subcommands (local database only)
+# ----------------------------------------------------------
+def cmd_export(args):
+    """Export transcripts from the local database to JSON or CSV."""
+    from extract_transcripts import extract_top_transcripts
+
+    if not require_database(args.db):
+        return 1
+
+    channel_id = args.channel.lstrip("@") if args.channel else None
+    output_file = args.output
+    if output_file is None:
+        output_file = f"transcripts_{channel_id or 'all'}.{args.format}"
+
+    count = extract_top_transcripts(
+        db_path=args.db,
+        output_file=output_file,
+        limit=args.limit,
+        channel_id=channel_id,
+        sort_order=args.sort,
+        export_format=args.format,
+        language=args.language,
+        languages=args.languages,
+    )
+    if not count:
+        print("No transcripts found.")
+        return 1
+    print(f"Successfully extracted {count} transcripts to {output_file}")
+    return 0
+
+
+def cmd_migrate(args):
+    """Create missing tables and columns in the database."""
+    from update_schema import update_schema
+
+    update_schema(args.db)
+    return 0
+
+
+def cmd_inspect(args):
+    """Print the columns of a table."""
+    from inspect_schema import inspect_schema
+
+    if not require_database(args.db):
+        return 1
+    inspect_schema(args.db, table=args.table)
+    return 0
+
+
+def cmd_gui(args):
+    """Launch the Tkinter export GUI."""
+    from transcript_gui import run_gui
+
+    if not require_database(args.db):
+        return 1
+    run_gui(db_path=args.db)
+    return 0
+
+
+# ----------------------------------------------------------
+# Argument parsing
+# ----------------------------------------------------------
+def build_parser():
+    default_languages = ",".join(DEFAULT_LANGUAGES)
+
+    parser = argparse.ArgumentParser(prog="cli.py", description="YouTube transcript tool.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH,
+                        help=f"SQLite database path (default: {DEFAULT_DB_PATH})")
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+
+    p = subparsers.add_parser("ingest", help="download transcripts for individual videos")
+    p.add_argument("urls", nargs="*", metavar="URL",
+                   help="video URLs; starts the interactive menu if omitted")
+    p.add_argument("--refresh-listings", action="store_true",
+                   help="re-list the videos' available transcripts instead of using the cache")
+    p.add_argument("--languages", type=parse_languages, default=DEFAULT_LANGUAGES,
+                   help=f"comma-separated transcript languages in priority order (default: {default_languages})")
+    p.add_argument("--client-secrets", default=DEFAULT_CLIENT_SECRETS,
+                   help="OAuth client secrets file")
+    p.set_defaults(func=cmd_ingest)
+
+    p = subparsers.add_parser("sync", help="download transcripts for a channel's uploads")
+    p.add_argument("channel_url", help="channel URL (/channel/..., /user/... or @handle)")
+    p.add_argument("--select", default="all",
+                   help="'all' (default), comma-separated video numbers, or 'ask' to choose interactively")
+    p.add_argument("--refresh-listings", action="store_true",
+                   help="re-list each video's available transcripts instead of using the cache")
+    p.add_argument("--languages", type=parse_languages, default=DEFAULT_LANGUAGES,
+                   help=f"comma-separated transcript languages in priority order (default: {default_languages})")
+    p.add_argument("--client-secrets", default=DEFAULT_CLIENT_SECRETS,
+                   help="OAuth client secrets file")
+    p.set_defaults(func=cmd_sync)
+
+    p = subparsers.add_parser("export", help="export transcripts to JSON or CSV")
+    p.add_argument("--channel", help="channel ID to export (default: all channels)")
+    p.add_argument("--sort", default="publish_date DESC", choices=SORT_ORDERS)
+    p.add_argument("--limit", type=int, default=250)
+    p.add_argument("--format", default="json", choices=["json", "csv"])
+    p.add_argument("--languages", type=parse_languages, default=DEFAULT_LANGUAGES,
+                   help="comma-separated language priority for picking one stored transcript per video; "
+                        f"falls back to any stored language (default: {default_languages})")
+    p.add_argument("--language", help="only export transcripts in exactly this language code")
+    p.add_argument("--output", "-o", help="output file (default: transcripts_<channel>.<format>)")
+    p.set_defaults(func=cmd_export)
+
+    p = subparsers.add_parser("migrate", help="bring the database schema up to date")
+    p.set_defaults(func=cmd_migrate)
+
+    p = subparsers.add_parser("inspect", help="show a table's columns")
+    p.add_argument("--table", default="videos", choices=["videos", "transcripts", "transcript_listings", "transcript_availability"])
+    p.set_defaults(func=cmd_inspect)
+
+    p = subparsers.add_parser("gui", help="launch the export GUI")
+    p.set_defaults(func=cmd_gui)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if getattr(args, "select", None) == "ask":
+        args.select = None
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+import sqlite3
+
+
+DEFAULT_DB_PATH = "transcripts.db"
+
+# Transcript languages to request when none are configured (matches youtube_transcript_api's default)
+DEFAULT_LANGUAGES = ("en",)
+
+# Columns added after the original schema, in the order they were introduced.
+ADDED_COLUMNS = {
+    "videos": [
+        ("channel_name", "TEXT DEFAULT ''"),
+        ("comment_count", "INTEGER DEFAULT 0"),
+        ("likes", "INTEGER DEFAULT 0"),
+        ("views", "INTEGER DEFAULT 0"),
+        ("duration", "INTEGER DEFAULT 0"),
+    ],
+    "transcripts": [
+        ("language", "TEXT"),
+    ],
+}
+
+# Rows written before transcripts.language existed came from get_transcript(video_id), whose default
+# languages are ('en',), so every legacy transcript is English.
+LEGACY_TRANSCRIPT_LANGUAGE = "en"
+
+# Listings with no transcripts (disabled, or captions not generated yet) are re-listed after this many
+# days; listings that found transcripts are kept until an explicit refresh.
+EMPTY_LISTING_MAX_AGE_DAYS = 1
+
+
+# ----------------------------------------------------------
+# Database Setup
+# ----------------------------------------------------------
+def create_database(db_path=DEFAULT_DB_PATH):
+    """
+    Create (if not exists) a SQLite database with tables for videos, transcripts
+    and the transcript-availability cache.
+    Returns a connection object.
+    """
+    # Connect to the SQLite database
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    # Create "videos" table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS videos (
+            video_id TEXT PRIMARY KEY,
+            title TEXT,
+            channel_id TEXT,
+            channel_name TEXT,
+            publish_date TEXT
+        )
+    """)
+
+    # Create "transcripts" table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS transcripts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            video_id TEXT,
+            start_time REAL,
+            text TEXT,
+            language TEXT,
+            FOREIGN KEY(video_id) REFERENCES videos(video_id)
+        )
+    """)
+
+    # Create "transcript_listings" table: one row per video whose transcripts have been listed
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS transcript_listings (
+            video_id TEXT PRIMARY KEY,
+            status TEXT,
+            listed_at TEXT,
+            FOREIGN KEY(video_id) REFERENCES videos(video_id)
+        )
+    """)
+
+    # Create "transcript_availability" table: the transcripts each listed video offers
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS transcript_availability (
+            video_id TEXT,
+            language_code TEXT,
+            language TEXT,
+            is_generated INTEGER,
+            PRIMARY KEY(video_id, language_code, is_generated),
+            FOREIGN KEY(video_id) REFERENCES videos(video_id)
+        )
+    """)
+
+    # Commit changes
+    conn.commit()
+    return conn
+
+
+def upgrade_schema(conn):
+    """
+    Add any columns from ADDED_COLUMNS that an older database is missing, and backfill
+    the language of transcripts stored before that column existed.
+    Returns the list of "table.column" names that were added.
+    """
+    cursor = conn.cursor()
+    added = []
+    for table, columns in ADDED_COLUMNS.items():
+        cursor.execute(f"PRAGMA table_info({table})")
+        existing = {row[1] for row in cursor.fetchall()}
+        for name, definition in columns:
+            if name not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+                added.append(f"{table}.{name}")
+
+    # New rows always set a language, so any NULL left is a legacy row
+    cursor.execute("UPDATE transcripts SET language = ? WHERE language IS NULL", (LEGACY_TRANSCRIPT_LANGUAGE,))
+    conn.commit()
+    return added
+
+
+# ----------------------------------------------------------
+# Transcript availability cache
+# ----------------------------------------------------------
+def get_transcript_availability(conn, video_id):
+    """
+    Return the cached transcript availability for a video, or None if it needs (re-)listing:
+    it has never been listed, or it was listed with no transcripts more than
+    EMPTY_LISTING_MAX_AGE_DAYS ago. A recent listing with no transcripts returns an empty list.
+    Each entry is a (language_code, language, is_generated) tuple, manual transcripts first.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT listed_at >= datetime('now', ?)
+        FROM transcript_listings
+        WHERE video_id = ?
+    """, (f"-{EMPTY_LISTING_MAX_AGE_DAYS} days", video_id))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    is_recent = bool(row[0])
+
+    cursor.execute("""
+        SELECT language_code, language, is_generated
+        FROM transcript_availability
+        WHERE video_id = ?
+        ORDER BY is_generated, language_code
+    """, (video_id,))
+    availability = [(code, language, bool(is_generated)) for code, language, is_generated in cursor.fetchall()]
+    if not availability and not is_recent:
+        return None
+    return availability
+
+
+def save_transcript_availability(conn, video_id, transcripts, status="ok"):
+    """
+    Cache the result of listing a video's transcripts, replacing any previous entry.
+    transcripts is an iterable of (language_code, language, is_generated) tuples.
+    """
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM transcript_availability WHERE video_id = ?", (video_id,))
+    cursor.executemany("""
+        INSERT OR IGNORE INTO transcript_availability (video_id, language_code, language, is_generated)
+        VALUES (?, ?, ?, ?)
+    """, [(video_id, code, language, int(is_generated)) for code, language, is_generated in transcripts])
+    cursor.execute("""
+        INSERT OR REPLACE INTO transcript_listings (video_id, status, listed_at)
+        VALUES (?, ?, datetime('now'))
+    """, (video_id, status))
+    conn.commit()
+
+
+def get_stored_languages(conn, video_id):
+    """Return the set of language codes already stored in the transcripts table for a video."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT DISTINCT language FROM transcripts WHERE video_id = ?", (video_id,))
+    return {row[0] for row in cursor.fetchall()}
+
+
+def choose_transcript(availability, languages):
+    """
+    Pick the transcript to fetch from cached availability, following the languages priority order.
+    Manually created transcripts win over auto-generated ones in the same language.
+    Returns a (language_code, is_generated) tuple, or None if no configured language is available.
+    """
+    for code in languages:
+        candidates = [is_generated for c, _, is_generated in availability if c == code]
+        if candidates:
+            return code, min(candidates)
+    return None
@@ -1,41 +1,96 @@
-import sqlite3
 import json
+import csv
+
+from database import DEFAULT_DB_PATH, DEFAULT_LANGUAGES, create_database, upgrade_schema
+
+# ORDER BY clauses accepted for exports (interpolated into SQL, so keep this a closed set)
+SORT_ORDERS = [
+    "publish_date DESC",
+    "publish_date ASC",
+    "likes DESC",
+    "views DESC",
+    "duration DESC",
+    "duration ASC",
+    "comment_count DESC",
+    "comment_count ASC",
+]
+
+EXPORT_FIELDS = ["video_id", "title", "publish_date", "comment_count", "language", "transcript_text"]
+
 
 # Connect to the database
-def extract_top_transcripts(db_path="transcripts.db", output_file="top_transcripts.json", limit=250):
-    conn = sqlite3.connect(db_path)
+def extract_top_transcripts(db_path=DEFAULT_DB_PATH, output_file="top_transcripts.json", limit=250,
+                            channel_id=None, sort_order="publish_date DESC", export_format="json",
+                            language=None, languages=DEFAULT_LANGUAGES):
+    """
+    Export the top `limit` videos (optionally for one channel) with their joined transcript text
+    to JSON or CSV. Each video contributes one transcript: the first stored language in the
+    `languages` priority list, falling back to any stored language. If language is given, only
+    videos with a transcript in that language are exported.
+    The database schema is brought up to date first, as `migrate` would.
+    Returns the number of transcripts written; nothing is written if there are none.
+    """
+    if sort_order not in SORT_ORDERS:
+        raise ValueError(f"Unsupported sort order: {sort_order}")
+
+    if language is not None:
+        languages = (language,)
+    # Rank each stored language by its position in the priority list; others sort after, by code
+    rank = "CASE language " + " ".join("WHEN ? THEN %d" % i for i in range(len(languages))) + \
+        f" ELSE {len(languages)} END"
+
+    # Older databases may lack columns the export reads (comment_count, language, ...)
+    conn = create_database(db_path)
+    upgrade_schema(conn)
     cursor = conn.cursor()
 
-    # Query top videos by publish date (newest first) for the specified channel
-    cursor.execute("""
-        SELECT v.video_id, v.title, v.publish_date, GROUP_CONCAT(t.text, ' ') AS transcript_text
+    # Query top videos in the requested order, restricted to one channel if given
+    cursor.execute(f"""
+        WITH chosen AS (
+            SELECT video_id, language
+            FROM (
+                SELECT video_id, language,
+                       ROW_NUMBER() OVER (PARTITION BY video_id ORDER BY {rank}, language) AS pick
+                FROM (SELECT DISTINCT video_id, language FROM transcripts)
+                WHERE ? IS NULL OR language = ?
+            )
+            WHERE pick = 1
+        )
+        SELECT v.video_id, v.title, v.publish_date, v.comment_count, c.language,
+               GROUP_CONCAT(t.text, ' ') AS transcript_text
         FROM videos v
-        LEFT JOIN transcripts t ON v.video_id = t.video_id
-        WHERE v.channel_id = 'UCXXXXXX'  # Replace with the actual channel ID for @DragonsDenGlobal
+        LEFT JOIN chosen c ON v.video_id = c.video_id
+        LEFT JOIN transcripts t ON v.video_id = t.video_id AND t.language = c.language
+        WHERE (? IS NULL OR v.channel_id = ?)
+          AND (? IS NULL OR c.language IS NOT NULL)
         GROUP BY v.video_id
-        ORDER BY v.publish_date DESC
+        ORDER BY {sort_order}
         LIMIT ?
-    """, (limit,))
+    """, (*languages, language, language, channel_id, channel_id, language, limit))
 
     # Fetch results
     results = cursor.fetchall()
+    conn.close()
+
+    if not results:
+        return 0
 
     # Format as a list of dictionaries
-    formatted_transcripts = []
-    for row in results:
-        formatted_transcripts.append({
-            "video_id": row[0],
-            "title": row[1],
-            "publish_date": row[2],
-            "transcript_text": row[3]
-        })
+    formatted_transcripts = [dict(zip(EXPORT_FIELDS, row)) for row in results]
 
-    # Save to JSON
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(formatted_transcripts, f, indent=2)
+    # Save to JSON or CSV
+    if export_format == "json":
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(formatted_transcripts, f, indent=2)
+    else:
+        with open(output_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(formatted_transcripts)
 
-    print(f"Successfully extracted {len(formatted_transcripts)} transcripts to {output_file}")
+    return len(formatted_transcripts)
 
 
 if __name__ == "__main__":
-    extract_top_transcripts()
+    count = extract_top_transcripts()
+    print(f"Successfully extracted {count} transcripts to top_transcripts.json")
@@ -1,15 +1,18 @@
 import sqlite3
+import sys
 
-def inspect_schema(db_path):
+from database import DEFAULT_DB_PATH
+
+def inspect_schema(db_path, table="videos"):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(videos)")
+    cursor.execute(f"PRAGMA table_info({table})")
     columns = cursor.fetchall()
     conn.close()
 
-    print("Columns in 'videos' table:")
+    print(f"Columns in '{table}' table:")
     for column in columns:
         print(column)
 
 if __name__ == "__main__":
-    inspect_schema("transcripts.db")
+    inspect_schema(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_PATH)
@@ -3,7 +3,6 @@
 import os
 import re
 import sys
-import sqlite3
 import datetime
 
 import google_auth_oauthlib.flow
@@ -13,44 +12,16 @@ import googleapiclient.errors
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 from google.auth.exceptions import GoogleAuthError
 
-
-# ----------------------------------------------------------
-# Database Setup
-# ----------------------------------------------------------
-def create_database(db_path="transcripts.db"):
-    """
-    Create (if not exists) a SQLite database with tables for videos and transcripts.
-    Returns a connection object.
-    """
-    # Connect to the SQLite database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Create "videos" table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS videos (
-            video_id TEXT PRIMARY KEY,
-            title TEXT,
-            channel_id TEXT,
-            channel_name TEXT,
-            publish_date TEXT
-        )
-    """)
-
-    # Create "transcripts" table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS transcripts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            video_id TEXT,
-            start_time REAL,
-            text TEXT,
-            FOREIGN KEY(video_id) REFERENCES videos(video_id)
-        )
-    """)
-
-    # Commit changes
-    conn.commit()
-    return conn
+from database import (
+    DEFAULT_DB_PATH,
+    DEFAULT_LANGUAGES,
+    choose_transcript,
+    create_database,
+    get_stored_languages,
+    get_transcript_availability,
+    save_transcript_availability,
+    upgrade_schema,
+)
 
 
 # ----------------------------------------------------------
@@ -79,7 +50,7 @@ def authenticate_youtube_api(client_secrets_file="client_secret.json"):
         )
         return youtube
     except FileNotFoundError:
-        print("Error: client_secret.json file not found. Please provide your OAuth client secrets file.")
+        print(f"Error: {client_secrets_file} file not found. Please provide your OAuth client secrets file.")
         sys.exit(1)
     except GoogleAuthError as e:
         print(f"Google Auth error: {e}")
@@ -87,7 +58,98 @@ def authenticate_youtube_api(client_secrets_file="client_secret.json"):
 
 
 # ----------------------------------------------------------
-# 2. Retrieve Single Video Transcript
+# 2. Retrieve Transcripts (cached availability, language priority)
+# ----------------------------------------------------------
+def get_available_transcripts(conn, video_id, refresh=False):
+    """
+    Return (availability, transcript_list) for a video.
+    availability comes from the transcript_availability cache when the video has been listed
+    before, in which case transcript_list is None and no request is made. Otherwise (or when
+    refresh is True) the video's transcripts are listed and the result is cached, including
+    videos with transcripts disabled.
+    """
+    if not refresh:
+        availability = get_transcript_availability(conn, video_id)
+        if availability is not None:
+            return availability, None
+
+    try:
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+    except TranscriptsDisabled:
+        save_transcript_availability(conn, video_id, [], status="disabled")
+        return [], None
+
+    availability = [(t.language_code, t.language, t.is_generated) for t in transcript_list]
+    save_transcript_availability(conn, video_id, availability)
+    return availability, transcript_list
+
+
+def download_transcript(conn, video_id, title, languages=DEFAULT_LANGUAGES, refresh=False):
+    """
+    Fetch the highest-priority available transcript for a video and store it with its language.
+    Videos known (from the cache) to lack every configured language, or that already have the
+    chosen language stored, are skipped without contacting YouTube. When a transcript does need
+    fetching after a cache hit, the video is listed again, since the transcript API can only
+    fetch from a fresh listing; that listing replaces the cached entry and the choice is made
+    again from it. refresh=True ignores the cache and re-lists the video.
+    Returns True if a transcript was stored.
+    """
+    try:
+        availability, transcript_list = get_available_transcripts(conn, video_id, refresh)
+
+        # Runs at most twice: once on cached availability, once on a fresh listing
+        while True:
+            choice = choose_transcript(availability, languages)
+            if choice is None:
+                if availability:
+                    available = ", ".join(sorted({code for code, _, _ in availability}))
+                    print(f"No transcript in {', '.join(languages)} for '{title}' (available: {available}).")
+                else:
+                    print(f"No transcripts available for '{title}'.")
+                return False
+
+            language_code, is_generated = choice
+            if language_code in get_stored_languages(conn, video_id):
+                print(f"Transcript ({language_code}) already stored for '{title}'.")
+                return False
+
+            if transcript_list is not None:
+                break
+
+            # Cached availability only tells us what exists; fetching needs a fresh listing,
+            # which also corrects the cache if the video's transcripts have changed
+            availability, transcript_list = get_available_transcripts(conn, video_id, refresh=True)
+
+        if is_generated:
+            transcript = transcript_list.find_generated_transcript([language_code])
+        else:
+            transcript = transcript_list.find_manually_created_transcript([language_code])
+        lines = transcript.fetch()
+    except TranscriptsDisabled:
+        print(f"Transcript disabled for '{title}'.")
+        return False
+    except NoTranscriptFound:
+        print(f"No transcript found for '{title}'.")
+        return False
+    except Exception as e:
+        print(f"Error retrieving transcript for '{title}': {e}")
+        return False
+
+    # Store each line in the "transcripts" table
+    cursor = conn.cursor()
+    cursor.executemany("""
+        INSERT INTO transcripts (video_id, start_time, text, language)
+        VALUES (?, ?, ?, ?)
+    """, [(video_id, line["start"], line["text"], language_code) for line in lines])
+    conn.commit()
+
+    kind = "auto-generated" if is_generated else "manual"
+    print(f"Transcript ({language_code}, {kind}) for '{title}' has been saved into the database.")
+    return True
+
+
+# ----------------------------------------------------------
+# 3. Retrieve Single Video Transcript
 # ----------------------------------------------------------
 def parse_video_id_from_url(url):
     """
@@ -110,7 +172,7 @@ def parse_video_id_from_url(url):
     return None
 
 
-def download_single_video_transcript(youtube, conn, video_url):
+def download_single_video_transcript(youtube, conn, video_url, languages=DEFAULT_LANGUAGES, refresh=False):
     """
     Downloads the transcript for a single video and stores its metadata in the database.
     
@@ -118,6 +180,8 @@ def download_single_video_transcript(youtube, conn, video_url):
     youtube: The YouTube API client.
     conn: SQLite database connection.
     video_url: URL of the YouTube video.
+    languages: Language codes to try, in descending priority.
+    refresh: Re-list the video's transcripts instead of using the cached availability.
     """
     # Function to download a single video transcript and store metadata in the database
 
@@ -156,37 +220,15 @@ def download_single_video_transcript(youtube, conn, video_url):
         print(f"Found video: {title} (ID: {video_id})")
         print("Attempting to download transcript...")
 
-        # Fetch transcript
-        try:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id)
-        except TranscriptsDisabled:
-            print("Transcript is disabled for this video.")
-            return
-        except NoTranscriptFound:
-            print("No transcript found for this video (it may be auto-generated but not available).")
-            return
-        except Exception as e:
-            print(f"Error fetching transcript: {e}")
-            return
-
-        # Store each line in the "transcripts" table
-        for line in transcript:
-            start_time = line["start"]
-            text = line["text"]
-            cursor.execute("""
-                INSERT INTO transcripts (video_id, start_time, text)
-                VALUES (?, ?, ?)
-            """, (video_id, start_time, text))
-
-        conn.commit()
-        print(f"Transcript for '{title}' has been saved into the database.")
+        # Fetch and store transcript
+        download_transcript(conn, video_id, title, languages, refresh)
 
     except googleapiclient.errors.HttpError as e:
         print(f"API Error: {e}")
 
 
 # ----------------------------------------------------------
-# 3. Advanced Option: Retrieve all transcripts from a channel
+# 4. Advanced Option: Retrieve all transcripts from a channel
 # ----------------------------------------------------------
 def extract_channel_identifier(channel_url):
     """
@@ -328,7 +370,8 @@ def get_all_video_ids(youtube, uploads_playlist_id):
     return video_data
 
 
-def download_channel_videos_transcripts(youtube, conn, channel_url):
+def download_channel_videos_transcripts(youtube, conn, channel_url, selection=None, languages=DEFAULT_LANGUAGES,
+                                        refresh=False):
     """
     Advanced function to fetch transcripts for all (or selected) videos in a channel.
     1. Parse the channel ID.
@@ -336,6 +379,10 @@ def download_channel_videos_transcripts(youtube, conn, channel_url):
     3. Retrieve all video IDs.
     4. Let user select which ones to process.
     5. Download transcripts for those videos.
+
+    If selection is given ('all' or comma-separated numbers), the interactive
+    prompt is skipped. languages are tried in descending priority; refresh re-lists
+    each video's transcripts instead of using the cached availability.
     """
     identifier_dict = extract_channel_identifier(channel_url)
     channel_id = get_channel_id(youtube, identifier_dict)
@@ -353,18 +400,20 @@ def download_channel_videos_transcripts(youtube, conn, channel_url):
     if total_videos == 0:
         return
 
-    # Show up to 50, let user pick
-    max_display = 50
-    print("\n=== Video List (showing up to 50) ===")
-    for i, (vid_id, vid_title, pub_date, ch_id) in enumerate(video_data[:max_display], start=1):
-        print(f"{i}. {vid_title} (https://youtu.be/{vid_id})")
+    if selection is None:
+        # Show up to 50, let user pick
+        max_display = 50
+        print("\n=== Video List (showing up to 50) ===")
+        for i, (vid_id, vid_title, pub_date, ch_id) in enumerate(video_data[:max_display], start=1):
+            print(f"{i}. {vid_title} (https://youtu.be/{vid_id})")
 
-    if total_videos > max_display:
-        print(f"... (only first {max_display} shown) ...")
+        if total_videos > max_display:
+            print(f"... (only first {max_display} shown) ...")
 
-    print()
-    print("Enter the numbers of the videos you want transcripts for (comma-separated), or 'all' to select all.")
-    selection = input("> ").strip().lower()
+        print()
+        print("Enter the numbers of the videos you want transcripts for (comma-separated), or 'all' to select all.")
+        selection = input("> ")
+    selection = selection.strip().lower()
 
     if selection == "all":
         selected_indices = range(1, total_videos + 1)
@@ -400,42 +449,26 @@ def download_channel_videos_transcripts(youtube, conn, channel_url):
         conn.commit()
 
         print(f"Downloading transcript for: {vid_title} (ID: {vid_id})")
-        try:
-            transcript = YouTubeTranscriptApi.get_transcript(vid_id)
-            # Insert transcript lines into DB
-            for line in transcript:
-                start_time = line["start"]
-                text = line["text"]
-                cursor.execute("""
-                    INSERT INTO transcripts (video_id, start_time, text)
-                    VALUES (?, ?, ?)
-                """, (vid_id, start_time, text))
-            conn.commit()
-            print(f"Transcript stored for '{vid_title}'")
-
-        except TranscriptsDisabled:
-            print(f"Transcript disabled for {vid_title}.")
-        except NoTranscriptFound:
-            print(f"No transcript found for {vid_title}.")
-        except Exception as e:
-            print(f"Error retrieving transcript for {vid_title}: {e}")
+        download_transcript(conn, vid_id, vid_title, languages, refresh)
 
 
 # ----------------------------------------------------------
 # Main
 # ----------------------------------------------------------
-def main():
+def main(db_path=DEFAULT_DB_PATH, client_secrets_file="client_secret.json", languages=DEFAULT_LANGUAGES,
+         refresh=False):
     """
     Main function to run the YouTube Transcript Tool.
     """
     print("=== YouTube Transcript Tool (Single Video or Channel) ===")
 
     # Initialize our local DB
-    conn = create_database(db_path="transcripts.db")
+    conn = create_database(db_path=db_path)
+    upgrade_schema(conn)
 
     # Authentication
     print("\nStep 1: Authenticating with Google...")
-    youtube = authenticate_youtube_api()
+    youtube = authenticate_youtube_api(client_secrets_file)
 
     while True:
         print("\nSelect an option:")
@@ -446,10 +479,11 @@ def main():
 
         if choice == "1":
             video_url = input("Enter the full YouTube video URL: ").strip()
-            download_single_video_transcript(youtube, conn, video_url)
+            download_single_video_transcript(youtube, conn, video_url, languages, refresh)
         elif choice == "2":
             channel_url = input("Enter the channel URL (e.g., https://www.youtube.com/channel/UC...): ").strip()
-            download_channel_videos_transcripts(youtube, conn, channel_url)
+            download_channel_videos_transcripts(youtube, conn, channel_url, languages=languages,
+                                                refresh=refresh)
         elif choice == "3":
             print("Goodbye!")
             break
@@ -1,12 +1,17 @@
 import sqlite3
-import json
-import csv
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from database import DEFAULT_DB_PATH, create_database, upgrade_schema
+from extract_transcripts import extract_top_transcripts
+
 class TranscriptExtractorGUI:
-    def __init__(self, root):
+    # Language dropdown entry that exports one transcript per video by language priority
+    BEST_LANGUAGE = "Best available"
+
+    def __init__(self, root, db_path=DEFAULT_DB_PATH):
         self.root = root
+        self.db_path = db_path
         self.root.title("Transcript Extractor")
 
         # Channel Selection
@@ -39,76 +44,77 @@ class TranscriptExtractorGUI:
         ttk.Radiobutton(root, text="JSON", variable=self.format_var, value="json").grid(row=6, column=1, padx=10, pady=5)
         ttk.Radiobutton(root, text="CSV", variable=self.format_var, value="csv").grid(row=6, column=2, padx=10, pady=5)
 
+        # Language Selection
+        tk.Label(root, text="Language:").grid(row=7, column=0, padx=10, pady=10)
+        self.language_var = tk.StringVar(value=self.BEST_LANGUAGE)
+        self.language_dropdown = ttk.Combobox(root, textvariable=self.language_var, state="readonly")
+        self.language_dropdown.grid(row=7, column=1, padx=10, pady=10)
+        self.language_dropdown["values"] = [self.BEST_LANGUAGE] + self.get_languages()
+
         # Extract Button
-        ttk.Button(root, text="Extract Transcripts", command=self.extract_transcripts).grid(row=7, column=1, padx=10, pady=20)
+        ttk.Button(root, text="Extract Transcripts", command=self.extract_transcripts).grid(row=8, column=1, padx=10, pady=20)
 
     def get_channels(self):
         """Fetch all unique channels from the database and format with @ sign."""
-        conn = sqlite3.connect("transcripts.db")
+        conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("SELECT DISTINCT channel_id FROM videos")
         channels = [f"@{row[0]}" for row in cursor.fetchall()]
         conn.close()
         return channels
 
+    def get_languages(self):
+        """Fetch all transcript languages stored in the database."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT DISTINCT language FROM transcripts WHERE language IS NOT NULL ORDER BY language")
+        languages = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return languages
+
     def extract_transcripts(self):
         """Extract transcripts based on user selections."""
         channel_id = self.channel_var.get().lstrip("@")
         sort_order = self.sort_var.get()
         limit = self.limit_var.get()
         export_format = self.format_var.get()
+        language = self.language_var.get()
+        if language == self.BEST_LANGUAGE:
+            language = None
 
         if not channel_id:
             messagebox.showerror("Error", "Please select a channel.")
             return
 
-        conn = sqlite3.connect("transcripts.db")
-        cursor = conn.cursor()
-
-        # Query transcripts
-        cursor.execute(f"""
-            SELECT v.video_id, v.title, v.publish_date, v.comment_count, GROUP_CONCAT(t.text, ' ') AS transcript_text
-            FROM videos v
-            LEFT JOIN transcripts t ON v.video_id = t.video_id
-            WHERE v.channel_id = ?
-            GROUP BY v.video_id
-            ORDER BY {sort_order}
-            LIMIT ?
-        """, (channel_id, limit))
-
-        results = cursor.fetchall()
-        conn.close()
-
-        if not results:
+        # Export transcripts
+        output_file = f"transcripts_{channel_id}.{export_format}"
+        count = extract_top_transcripts(
+            db_path=self.db_path,
+            output_file=output_file,
+            limit=limit,
+            channel_id=channel_id,
+            sort_order=sort_order,
+            export_format=export_format,
+            language=language,
+        )
+
+        if not count:
             messagebox.showinfo("Info", "No transcripts found for the selected channel.")
             return
 
-        # Format results
-        formatted_transcripts = []
-        for row in results:
-            formatted_transcripts.append({
-                "video_id": row[0],
-                "title": row[1],
-                "publish_date": row[2],
-                "comment_count": row[3],
-                "transcript_text": row[4]
-            })
-
-        # Save to file
-        output_file = f"transcripts_{channel_id}.{export_format}"
-        if export_format == "json":
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(formatted_transcripts, f, indent=2)
-        else:
-            with open(output_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=["video_id", "title", "publish_date", "comment_count", "transcript_text"])
-                writer.writeheader()
-                writer.writerows(formatted_transcripts)
+        messagebox.showinfo("Success", f"Successfully extracted {count} transcripts to {output_file}")
 
-        messagebox.showinfo("Success", f"Successfully extracted {len(formatted_transcripts)} transcripts to {output_file}")
 
+def run_gui(db_path=DEFAULT_DB_PATH):
+    # The GUI reads columns older databases may lack, so bring the schema up to date first
+    conn = create_database(db_path)
+    upgrade_schema(conn)
+    conn.close()
 
-if __name__ == "__main__":
     root = tk.Tk()
-    app = TranscriptExtractorGUI(root)
+    app = TranscriptExtractorGUI(root, db_path)
     root.mainloop()
+
+
+if __name__ == "__main__":
+    run_gui()
@@ -1,17 +1,21 @@
-import sqlite3
+import sys
 
-def update_schema(db_path):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+from database import DEFAULT_DB_PATH, create_database, upgrade_schema
 
-    # Add new columns if they don't exist
-    cursor.execute("ALTER TABLE videos ADD COLUMN likes INTEGER DEFAULT 0")
-    cursor.execute("ALTER TABLE videos ADD COLUMN views INTEGER DEFAULT 0")
-    cursor.execute("ALTER TABLE videos ADD COLUMN duration INTEGER DEFAULT 0")
 
-    conn.commit()
+def update_schema(db_path):
+    """
+    Bring an existing database up to the current schema.
+    Tables are created if missing and only columns that don't exist yet are added,
+    so running this more than once is safe.
+    """
+    conn = create_database(db_path)
+    added = upgrade_schema(conn)
     conn.close()
-    print("Schema updated successfully.")
+    if added:
+        print(f"Schema updated successfully (added: {', '.join(added)}).")
+    else:
+        print("Schema is already up to date.")
 
 if __name__ == "__main__":
-    update_schema("transcripts.db")
+    update_schema(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_PATH)